@@ -0,0 +1,329 @@
+"""Build every generated artifact in the repo, skipping anything already up to date.
+
+Usage:
+    python build.py                 # build everything
+    python build.py pptx -j 4       # one target (and its dependencies), 4 workers
+    python build.py --list
+    python build.py --force
+
+Targets form a DAG: the deck is built from generate_pptx.py, its helper
+modules and the outline; each Word prompt from its markdown source (via
+pandoc); each zip bundle from its directory. A target is up to date when the
+SHA-1 of its inputs and outputs match the last successful build, recorded in
+.build-state.json. Independent targets run concurrently on a thread pool.
+
+A target with no recorded build yet (a fresh clone) is built into a temp
+file first; if the output already in the repo has the same content, it is
+kept as is and only the state is recorded. When pandoc is missing, the
+committed .docx files are kept the same way rather than failing.
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, NamedTuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = os.path.join(ROOT, ".build-state.json")
+LIBRARY = "Prompt Library"
+MARKDOWN_DIR = f"{LIBRARY}/prompt library"
+DOCX_DIR = f"{LIBRARY}/Word Document Prompt Library"
+CURSOR_DIR = f"{LIBRARY}/Cursor Rules/CursorRules"
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)  # fixed member timestamp, so bundles are reproducible
+# OPC metadata parts holding creation/modification times, ignored when comparing packages
+_VOLATILE = ("docProps/core.xml",)
+
+
+class Target(NamedTuple):
+    name: str
+    inputs: list  # source files, repo-relative
+    outputs: list
+    action: Callable
+    deps: tuple = ()
+
+
+class ToolMissing(RuntimeError):
+    """An action's external tool isn't installed."""
+
+
+# ── Actions ──
+
+def _path(rel):
+    return os.path.join(ROOT, rel)
+
+
+def _run(cmd):
+    result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or result.stdout.strip()
+                           or f"{cmd[0]} exited with {result.returncode}")
+
+
+def build_pptx(target, out):
+    _run([sys.executable, "generate_pptx.py", out])
+
+
+def build_docx(target, out):
+    if shutil.which("pandoc") is None:
+        raise ToolMissing("pandoc is not installed; it is needed to build the .docx prompts")
+    _run(["pandoc", "--from", "gfm", "--to", "docx",
+          "--output", out, _path(target.inputs[0])])
+
+
+def build_zip(target, out):
+    """Zip the inputs flat (no directory prefix), matching the bundles already in the repo."""
+    with zipfile.ZipFile(out, "w") as zf:
+        for rel in target.inputs:
+            info = zipfile.ZipInfo(os.path.basename(rel), ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            with open(_path(rel), "rb") as f:
+                zf.writestr(info, f.read())
+
+
+def _members(source):
+    """{name: content} of a zip package, nested packages expanded, timestamps ignored."""
+    with zipfile.ZipFile(source) as zf:
+        members = {}
+        for info in zf.infolist():
+            if info.filename in _VOLATILE:
+                continue
+            data = zf.read(info)
+            if data.startswith(b"PK\x03\x04"):
+                data = _members(io.BytesIO(data))
+            members[info.filename] = data
+        return members
+
+
+def _produce(target, keep_if_same=False):
+    """Run *target*'s action into a temp file and move it over the output.
+
+    With *keep_if_same*, an existing output with the same content is left
+    untouched. Returns True if the output was replaced.
+    """
+    out = _path(target.outputs[0])
+    root, ext = os.path.splitext(out)
+    tmp = f"{root}.tmp{ext}"
+    try:
+        target.action(target, tmp)
+        if keep_if_same and os.path.exists(out) and _members(out) == _members(tmp):
+            os.unlink(tmp)
+            return False
+        os.replace(tmp, out)
+        return True
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+# ── Targets ──
+
+def _files(pattern):
+    return sorted(os.path.relpath(p, ROOT).replace(os.sep, "/")
+                  for p in glob.glob(_path(pattern)) if os.path.isfile(p))
+
+
+def targets():
+    """Return the build graph as {name: Target}."""
+    graph = {}
+
+    def add(target):
+        graph[target.name] = target
+
+    add(Target("pptx",
+               ["generate_pptx.py", "pptx_charts.py", "pptx_layout.py", "04-presentation-outline.md"],
+               ["get-shit-done-framework.pptx"], build_pptx))
+
+    docx_names = []
+    for md in _files(f"{MARKDOWN_DIR}/*.md"):
+        stem = os.path.splitext(os.path.basename(md))[0]
+        name = f"docx:{stem}"
+        docx_names.append(name)
+        add(Target(name, [md], [f"{DOCX_DIR}/{stem}.docx"], build_docx))
+
+    add(Target("zip:prompt-library", _files(f"{MARKDOWN_DIR}/*.md"),
+               [f"{LIBRARY}/prompt library.zip"], build_zip))
+    add(Target("zip:word-prompt-library", [graph[n].outputs[0] for n in docx_names],
+               [f"{LIBRARY}/Word Document Prompt Library.zip"], build_zip, tuple(docx_names)))
+    add(Target("zip:cursor-rules", _files(f"{CURSOR_DIR}/.cursorrules") + _files(f"{CURSOR_DIR}/*.md"),
+               [f"{LIBRARY}/Cursor Rules/CursorRules.zip"], build_zip))
+    return graph
+
+
+# ── Up-to-date checks ──
+
+class HashCache:
+    """SHA-1 per file, re-read only when the file's size or mtime has changed."""
+
+    def __init__(self, entries):
+        self._entries = entries
+
+    def digest(self, rel):
+        try:
+            st = os.stat(_path(rel))
+        except FileNotFoundError:
+            return None
+        key = [st.st_size, st.st_mtime_ns]
+        cached = self._entries.get(rel)
+        if cached and cached[:2] == key:
+            return cached[2]
+        h = hashlib.sha1()
+        with open(_path(rel), "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        self._entries[rel] = key + [h.hexdigest()]
+        return self._entries[rel][2]
+
+
+def _fingerprint(cache, paths):
+    digests = [cache.digest(p) for p in paths]
+    if None in digests:
+        return None
+    h = hashlib.sha1()
+    for path, digest in zip(paths, digests):
+        h.update(f"{path}\0{digest}\n".encode())
+    return h.hexdigest()
+
+
+def _load_state():
+    try:
+        with open(STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"files": {}, "targets": {}}
+
+
+def _save_state(state):
+    tmp = STATE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, STATE_FILE)
+
+
+# ── Scheduler ──
+
+def _closure(graph, names):
+    wanted = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name in wanted:
+            continue
+        if name not in graph:
+            raise KeyError(f"unknown target {name!r}; see --list")
+        wanted.add(name)
+        stack.extend(graph[name].deps)
+    return wanted
+
+
+def build(names=None, jobs=None, force=False, dry_run=False):
+    """Build *names* (default: all) and their dependencies; return {name: (status, seconds)}."""
+    graph = targets()
+    wanted = _closure(graph, names or list(graph))
+    state = _load_state()
+    cache = HashCache(state["files"])
+    results = {}
+
+    def run(target):
+        start = time.perf_counter()
+        if dry_run and any(results[dep][0] == "would build" for dep in target.deps):
+            return "would build", time.perf_counter() - start, None
+        inputs = _fingerprint(cache, target.inputs)
+        if inputs is None:
+            missing = [p for p in target.inputs if cache.digest(p) is None]
+            raise RuntimeError(f"missing input {missing[0]}")
+        previous = state["targets"].get(target.name)
+        outputs = _fingerprint(cache, target.outputs)
+        if (not force and previous is not None and outputs is not None
+                and previous == {"inputs": inputs, "outputs": outputs}):
+            return "up to date", time.perf_counter() - start, None
+        if dry_run:
+            return "would build", time.perf_counter() - start, None
+        # First build here: the committed output may already be what we'd produce
+        seeding = not force and previous is None and outputs is not None
+        try:
+            status = "built" if _produce(target, keep_if_same=seeding) else "up to date"
+        except ToolMissing as exc:
+            if not seeding:
+                raise
+            status = f"kept existing output ({exc})"
+        outputs = _fingerprint(cache, target.outputs)
+        if outputs is None:
+            raise RuntimeError("action finished without writing every output")
+        return status, time.perf_counter() - start, {"inputs": inputs, "outputs": outputs}
+
+    pending = {name: set(graph[name].deps) & wanted for name in wanted}
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        while pending or running:
+            for name in sorted(n for n, deps in pending.items() if not deps):
+                del pending[name]
+                running[pool.submit(run, graph[name])] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    status, seconds, record = future.result()
+                except Exception as exc:
+                    results[name] = (f"FAILED: {exc}", 0.0)
+                    _skip_dependents(name, pending, results)
+                    continue
+                results[name] = (status, seconds)
+                if record is not None:
+                    state["targets"][name] = record
+                for deps in pending.values():
+                    deps.discard(name)
+
+    if not dry_run:
+        _save_state(state)
+    return results
+
+
+def _skip_dependents(failed, pending, results):
+    for name in [n for n, deps in pending.items() if failed in deps]:
+        if name in pending:
+            del pending[name]
+            results[name] = (f"skipped ({failed} failed)", 0.0)
+            _skip_dependents(name, pending, results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", help="targets to build (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker threads (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="report what would be built")
+    parser.add_argument("--list", action="store_true", help="list targets and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for target in targets().values():
+            deps = f"  (after {', '.join(target.deps)})" if target.deps else ""
+            print(f"{target.name:32} -> {', '.join(target.outputs)}{deps}")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        results = build(args.targets, args.jobs, args.force, args.dry_run)
+    except KeyError as exc:
+        parser.error(exc.args[0])
+    total = time.perf_counter() - start
+
+    for name, (status, seconds) in sorted(results.items(), key=lambda kv: -kv[1][1]):
+        print(f"{name:32} {seconds * 1000:9.1f} ms  {status}")
+    print(f"{len(results)} targets in {total * 1000:.1f} ms")
+    return 1 if any(status.startswith(("FAILED", "skipped")) for status, _ in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""Report which slides were added, removed, moved or changed between two decks.
+
+Usage:
+    python diff_pptx.py old.pptx new.pptx
+    python diff_pptx.py old.pptx new.pptx --format json
+
+Slides are fingerprinted from the CRC-32 and size that the zip central
+directory already records for each slide, its notes and the parts it relates
+to (charts, images), so unchanged slides are never decompressed. Only slides
+whose fingerprints differ are parsed for a text-level diff of their runs and
+speaker notes. Exits 1 when the decks differ, like diff(1).
+"""
+
+import argparse
+import difflib
+import json
+import sys
+import zipfile
+from typing import NamedTuple
+
+from pptx_parts import NS, RT_NOTES_SLIDE, paragraphs, parse, read_rels, slide_partnames
+
+# Shared parts every slide points at; a change there is not a change to the slide
+_SHARED_RELS = ("slideLayout", "slideMaster", "theme")
+
+
+class SlideRef(NamedTuple):
+    index: int
+    partname: str
+    notes: str
+    fingerprint: tuple
+    notes_fingerprint: tuple
+
+
+class Change(NamedTuple):
+    kind: str  # added | removed | moved | changed
+    old_index: int
+    new_index: int
+    title: str
+    text_diff: list
+    notes_diff: list
+
+
+def _crc(zf, partname):
+    info = zf.getinfo(partname)
+    return info.CRC, info.file_size
+
+
+def load_slides(zf):
+    """Fingerprint every slide in *zf* from zip metadata and the slide rels."""
+    refs = []
+    for index, partname in enumerate(slide_partnames(zf), 1):
+        notes = None
+        related = []
+        for reltype, target in sorted(read_rels(zf, partname).values()):
+            if reltype == RT_NOTES_SLIDE:
+                notes = target
+            elif not reltype.endswith(_SHARED_RELS) and target in zf.NameToInfo:
+                related.append(_crc(zf, target))
+        fingerprint = (_crc(zf, partname), *related)
+        notes_fingerprint = _crc(zf, notes) if notes else ()
+        refs.append(SlideRef(index, partname, notes, fingerprint, notes_fingerprint))
+    return refs
+
+
+def _text(zf, partname):
+    sp_tree = parse(zf, partname).find("p:cSld/p:spTree", NS)
+    return [t for t in paragraphs(sp_tree) if t.strip()]
+
+
+def slide_text(zf, ref):
+    return _text(zf, ref.partname)
+
+
+def notes_text(zf, ref):
+    return _text(zf, ref.notes) if ref.notes else []
+
+
+def _title(lines):
+    return lines[0] if lines else ""
+
+
+def _unified(old, new, label):
+    return list(difflib.unified_diff(old, new, f"a/{label}", f"b/{label}", n=1, lineterm=""))
+
+
+def diff_decks(old_path, new_path):
+    """Return the list of Change records turning *old_path* into *new_path*."""
+    with zipfile.ZipFile(old_path) as old_zf, zipfile.ZipFile(new_path) as new_zf:
+        old, new = load_slides(old_zf), load_slides(new_zf)
+        old_keys = [(r.fingerprint, r.notes_fingerprint) for r in old]
+        new_keys = [(r.fingerprint, r.notes_fingerprint) for r in new]
+        matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+
+        removed, added, changes = [], [], []
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                continue
+            pairs = min(i2 - i1, j2 - j1) if op == "replace" else 0
+            for a, b in zip(old[i1:i1 + pairs], new[j1:j1 + pairs]):
+                changes.append(_changed(old_zf, new_zf, a, b))
+            removed.extend(old[i1 + pairs:i2])
+            added.extend(new[j1 + pairs:j2])
+
+        # A slide deleted in one place and inserted identically elsewhere moved
+        moved_from = {}
+        for ref in removed:
+            moved_from.setdefault((ref.fingerprint, ref.notes_fingerprint), []).append(ref)
+        for ref in added:
+            sources = moved_from.get((ref.fingerprint, ref.notes_fingerprint))
+            if sources:
+                src = sources.pop(0)
+                changes.append(Change("moved", src.index, ref.index,
+                                      _title(slide_text(new_zf, ref)), [], []))
+                removed.remove(src)
+            else:
+                changes.append(Change("added", None, ref.index,
+                                      _title(slide_text(new_zf, ref)), [], []))
+        for ref in removed:
+            changes.append(Change("removed", ref.index, None,
+                                  _title(slide_text(old_zf, ref)), [], []))
+
+    changes.sort(key=lambda c: (c.new_index or c.old_index, c.kind != "removed"))
+    return changes
+
+
+def _changed(old_zf, new_zf, a, b):
+    text_diff = notes_diff = []
+    new_lines = slide_text(new_zf, b)
+    if a.fingerprint != b.fingerprint:
+        text_diff = _unified(slide_text(old_zf, a), new_lines, f"slide{b.index}")
+    if a.notes_fingerprint != b.notes_fingerprint:
+        notes_diff = _unified(notes_text(old_zf, a), notes_text(new_zf, b), f"slide{b.index}/notes")
+    return Change("changed", a.index, b.index, _title(new_lines), text_diff, notes_diff)
+
+
+def _describe(change):
+    if change.kind == "added":
+        where = f"slide {change.new_index}"
+    elif change.kind == "removed":
+        where = f"slide {change.old_index}"
+    else:
+        where = f"slide {change.old_index} -> {change.new_index}"
+    symbol = {"added": "+", "removed": "-", "moved": ">", "changed": "~"}[change.kind]
+    return f"{symbol} {change.kind} {where}: {change.title!r}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(argv)
+
+    changes = diff_decks(args.old, args.new)
+    if args.format == "json":
+        json.dump([c._asdict() for c in changes], sys.stdout, indent=2)
+        print()
+    else:
+        for change in changes:
+            print(_describe(change))
+            if change.kind == "changed" and not (change.text_diff or change.notes_diff):
+                print("    (formatting or layout only)")
+            for line in change.text_diff + change.notes_diff:
+                print(f"    {line}")
+        if not changes:
+            print("decks are identical slide for slide")
+    return 1 if changes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
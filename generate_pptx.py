@@ -1,11 +1,19 @@
 """Generate the Get Shit Done Framework PowerPoint presentation."""
 
+import io
+import os
+import sys
+import zipfile
+
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+from pptx_charts import add_chart
+from pptx_layout import column, grid, row
+
 # ── Colour Palette ──
 NAVY = RGBColor(0x1B, 0x2A, 0x4A)
 DARK_NAVY = RGBColor(0x0F, 0x1A, 0x33)
@@ -139,23 +147,19 @@ add_text_box(slide, Inches(0.8), Inches(0.5), Inches(8), Inches(0.8),
              font_name="Calibri Light")
 add_accent_bar(slide, Inches(0.8), Inches(1.2), Inches(3))
 
-# Quality zones - visual representation
+# Quality zones - native bar chart of relative output quality per context band
 zones = [
-    ("0-30%", "PEAK", GREEN, Inches(1.5)),
-    ("30-50%", "GOOD", YELLOW, Inches(1.2)),
-    ("50-70%", "DEGRADING", ORANGE, Inches(0.9)),
-    ("70%+", "POOR", RED, Inches(0.6)),
+    ("0-30%", "PEAK", GREEN, 100),
+    ("30-50%", "GOOD", YELLOW, 80),
+    ("50-70%", "DEGRADING", ORANGE, 60),
+    ("70%+", "POOR", RED, 40),
 ]
 
-x_start = Inches(0.8)
-y_start = Inches(2.0)
-bar_width = Inches(2.5)
-
-for i, (label, quality, color, height) in enumerate(zones):
-    y = y_start + Inches(i * 1.15)
-    bar = add_rect(slide, x_start, y, bar_width, height, color)
-    add_text_box(slide, x_start + Inches(0.2), y + Pt(4), Inches(2), Inches(0.4),
-                 f"{label}  {quality}", font_size=14, color=DARK_NAVY, bold=True)
+add_chart(slide, Inches(0.8), Inches(1.8), Inches(5.2), Inches(4.4),
+          [f"{label}  {quality}" for label, quality, _, _ in zones],
+          {"Output quality": [score for _, _, _, score in zones]},
+          kind="bar", point_colors=[color for _, _, color, _ in zones],
+          font_size=14, font_color=SOFT_WHITE, gap_width=40)
 
 add_text_box(slide, Inches(0.8), Inches(6.3), Inches(4), Inches(0.5),
              "Context Window Usage \u2192 Quality Degrades", font_size=13, color=MID_GREY)
@@ -236,12 +240,12 @@ principles = [
     ("NO ENTERPRISE\nTHEATRE", "Built for builders, not\nbureaucrats", ORANGE),
 ]
 
-for i, (title, desc, color) in enumerate(principles):
-    x = Inches(0.6) + Inches(i * 2.5)
-    y = Inches(2.0)
+principle_boxes = row(len(principles), Inches(0.6), Inches(2.0), Inches(12.3), Inches(4.5),
+                      gap=Inches(0.2))
+for i, ((title, desc, color), box) in enumerate(zip(principles, principle_boxes)):
+    x, y = box.left, box.top
 
-    card = add_shape(slide, x, y, Inches(2.3), Inches(4.5),
-                     RGBColor(0x15, 0x22, 0x3E), color)
+    card = add_shape(slide, *box, RGBColor(0x15, 0x22, 0x3E), color)
     # Number circle
     circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, x + Inches(0.85), y + Inches(0.3),
                                      Inches(0.6), Inches(0.6))
@@ -303,9 +307,11 @@ stages = [
 ]
 
 y_stage = Inches(3.2)
-for i, (name, cmd, desc, color) in enumerate(stages):
-    x = Inches(0.5) + Inches(i * 3.2)
-    box = add_shape(slide, x, y_stage, Inches(2.8), Inches(2.5), RGBColor(0x15, 0x22, 0x3E), color)
+stage_boxes = row(len(stages), Inches(0.5), y_stage, item_width=Inches(2.8), height=Inches(2.5),
+                  gap=Inches(0.4))
+for i, ((name, cmd, desc, color), stage_box) in enumerate(zip(stages, stage_boxes)):
+    x = stage_box.left
+    box = add_shape(slide, *stage_box, RGBColor(0x15, 0x22, 0x3E), color)
     add_text_box(slide, x + Inches(0.2), y_stage + Inches(0.2), Inches(2.4), Inches(0.5),
                  name, font_size=22, color=color, bold=True, alignment=PP_ALIGN.CENTER)
     add_text_box(slide, x + Inches(0.2), y_stage + Inches(0.8), Inches(2.4), Inches(0.4),
@@ -349,10 +355,11 @@ artifacts = [
     ("VERIFICATION.md", "Goal achievement report", RGBColor(0xAF, 0x7A, 0xC5)),
 ]
 
-for i, (name, desc, color) in enumerate(artifacts):
-    y = Inches(1.8) + Inches(i * 0.72)
-    bar = add_shape(slide, Inches(0.8), y, Inches(5.5), Inches(0.6),
-                    RGBColor(0x15, 0x22, 0x3E), color)
+artifact_boxes = column(len(artifacts), Inches(0.8), Inches(1.8), Inches(5.5),
+                        item_height=Inches(0.6), gap=Inches(0.12))
+for (name, desc, color), box in zip(artifacts, artifact_boxes):
+    y = box.top
+    bar = add_shape(slide, *box, RGBColor(0x15, 0x22, 0x3E), color)
     add_text_box(slide, Inches(1.0), y + Pt(4), Inches(2.2), Inches(0.4),
                  name, font_size=14, color=color, bold=True)
     add_text_box(slide, Inches(3.2), y + Pt(4), Inches(3), Inches(0.4),
@@ -476,8 +483,10 @@ annotations = [
     ("DONE", "Measurable acceptance\ncriteria", TEAL),
 ]
 
-for i, (label, desc, color) in enumerate(annotations):
-    y = Inches(1.8) + Inches(i * 1.0)
+annotation_boxes = column(len(annotations), Inches(8), Inches(1.8), Inches(4.5),
+                          item_height=Inches(0.9), gap=Inches(0.1))
+for (label, desc, color), box in zip(annotations, annotation_boxes):
+    y = box.top
     add_text_box(slide, Inches(8), y, Inches(2), Inches(0.3),
                  label, font_size=14, color=color, bold=True)
     add_text_box(slide, Inches(8), y + Inches(0.3), Inches(4.5), Inches(0.6),
@@ -548,10 +557,11 @@ benefits = [
     "Walk away, come back to completed work",
 ]
 y_bottom = Inches(5.8)
-for i, benefit in enumerate(benefits):
-    x = Inches(0.5) + Inches(i * 3.2)
-    add_shape(slide, x, y_bottom, Inches(3), Inches(0.9),
-              RGBColor(0x15, 0x22, 0x3E), MID_GREY)
+benefit_boxes = row(len(benefits), Inches(0.5), y_bottom, item_width=Inches(3), height=Inches(0.9),
+                    gap=Inches(0.2))
+for benefit, box in zip(benefits, benefit_boxes):
+    x = box.left
+    add_shape(slide, *box, RGBColor(0x15, 0x22, 0x3E), MID_GREY)
     add_text_box(slide, x + Inches(0.15), y_bottom + Pt(8), Inches(2.7), Inches(0.7),
                  benefit, font_size=12, color=SOFT_WHITE, alignment=PP_ALIGN.CENTER)
 
@@ -626,22 +636,23 @@ table_top = Inches(1.8)
 col_w = Inches(2.8)
 row_h = Inches(0.55)
 
-for r, row in enumerate(profiles):
-    for c, cell in enumerate(row):
-        x = Inches(0.8) + Inches(c * 2.8)
-        y = table_top + Inches(r * 0.6)
-        if r == 0:
-            bg_color = TEAL
-            text_color = DARK_NAVY
-            bold = True
-        else:
-            bg_color = RGBColor(0x15, 0x22, 0x3E)
-            text_color = SOFT_WHITE
-            bold = (c == 0)
-        cell_shape = add_rect(slide, x, y, col_w, row_h, bg_color)
-        add_text_box(slide, x + Inches(0.15), y + Pt(4), col_w - Inches(0.3), row_h,
-                     cell, font_size=14, color=text_color, bold=bold,
-                     alignment=PP_ALIGN.CENTER)
+cell_boxes = grid(len(profiles) * len(profiles[0]), len(profiles[0]), Inches(0.8), table_top,
+                  item_width=col_w, item_height=row_h, row_gap=Inches(0.05))
+cells = [(r, c, cell) for r, profile in enumerate(profiles) for c, cell in enumerate(profile)]
+for (r, c, cell), box in zip(cells, cell_boxes):
+    x, y = box.left, box.top
+    if r == 0:
+        bg_color = TEAL
+        text_color = DARK_NAVY
+        bold = True
+    else:
+        bg_color = RGBColor(0x15, 0x22, 0x3E)
+        text_color = SOFT_WHITE
+        bold = (c == 0)
+    cell_shape = add_rect(slide, x, y, col_w, row_h, bg_color)
+    add_text_box(slide, x + Inches(0.15), y + Pt(4), col_w - Inches(0.3), row_h,
+                 cell, font_size=14, color=text_color, bold=bold,
+                 alignment=PP_ALIGN.CENTER)
 
 # Right side: other settings
 add_text_box(slide, Inches(0.8), Inches(4.5), Inches(5), Inches(0.4),
@@ -698,10 +709,11 @@ panels = [
     ], GREEN, "[B]"),
 ]
 
-for i, (title, cmd, items, color, icon) in enumerate(panels):
-    x = Inches(0.5) + Inches(i * 4.2)
-    card = add_shape(slide, x, Inches(1.7), Inches(3.9), Inches(5.3),
-                     RGBColor(0x15, 0x22, 0x3E), color)
+panel_boxes = row(len(panels), Inches(0.5), Inches(1.7), item_width=Inches(3.9), height=Inches(5.3),
+                  gap=Inches(0.3))
+for (title, cmd, items, color, icon), box in zip(panels, panel_boxes):
+    x = box.left
+    card = add_shape(slide, *box, RGBColor(0x15, 0x22, 0x3E), color)
     add_text_box(slide, x + Inches(0.3), Inches(1.9), Inches(3.3), Inches(0.4),
                  f"{icon}  {title}", font_size=18, color=color, bold=True)
     add_text_box(slide, x + Inches(0.3), Inches(2.5), Inches(3.3), Inches(0.5),
@@ -731,10 +743,11 @@ cards = [
     ("OPEN SOURCE\nMIT LICENSE", "Active community.\nFast evolution. Used\nat top tech companies.", RGBColor(0xAF, 0x7A, 0xC5)),
 ]
 
-for i, (title, desc, color) in enumerate(cards):
-    x = Inches(0.5) + Inches(i * 3.2)
-    y = Inches(1.8)
-    card = add_shape(slide, x, y, Inches(3), Inches(3), RGBColor(0x15, 0x22, 0x3E), color)
+card_boxes = row(len(cards), Inches(0.5), Inches(1.8), item_width=Inches(3), height=Inches(3),
+                 gap=Inches(0.2))
+for (title, desc, color), box in zip(cards, card_boxes):
+    x, y = box.left, box.top
+    card = add_shape(slide, *box, RGBColor(0x15, 0x22, 0x3E), color)
     # Top accent bar
     add_rect(slide, x, y, Inches(3), Pt(4), color)
     add_text_box(slide, x + Inches(0.3), y + Inches(0.4), Inches(2.4), Inches(0.8),
@@ -776,8 +789,10 @@ steps = [
     ("5", "SHIP", "/gsd:complete-milestone", TEAL),
 ]
 
-for i, (num, label, cmd, color) in enumerate(steps):
-    y = Inches(1.7) + Inches(i * 0.95)
+step_boxes = column(len(steps), Inches(3.3), Inches(1.7), Inches(6),
+                    item_height=Inches(0.6), gap=Inches(0.35))
+for (num, label, cmd, color), step_box in zip(steps, step_boxes):
+    y = step_box.top
     # Number circle
     circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.8), y + Pt(4),
                                      Inches(0.5), Inches(0.5))
@@ -795,8 +810,7 @@ for i, (num, label, cmd, color) in enumerate(steps):
     add_text_box(slide, Inches(1.6), y + Pt(2), Inches(1.5), Inches(0.5),
                  label, font_size=18, color=color, bold=True)
     # Command in monospace box
-    cmd_bg = add_shape(slide, Inches(3.3), y, Inches(6), Inches(0.6),
-                       RGBColor(0x0A, 0x12, 0x28), RGBColor(0x33, 0x44, 0x66))
+    cmd_bg = add_shape(slide, *step_box, RGBColor(0x0A, 0x12, 0x28), RGBColor(0x33, 0x44, 0x66))
     add_text_box(slide, Inches(3.5), y + Pt(4), Inches(5.6), Inches(0.4),
                  cmd, font_size=14, color=SOFT_WHITE, font_name="Consolas")
 
@@ -814,7 +828,23 @@ add_notes(slide, "Getting started is one command: npx get-shit-done-cc. Verify w
 # ═══════════════════════════════════════════════════════════════
 # SAVE
 # ═══════════════════════════════════════════════════════════════
-output_path = r"C:\Users\dosoor\Projects\GSD-Framework\get-shit-done-framework.pptx"
-prs.save(output_path)
+# Defaults to the deck alongside this script; build.py passes an explicit path
+output_path = (sys.argv[1] if len(sys.argv) > 1 else
+               os.path.join(os.path.dirname(os.path.abspath(__file__)), "get-shit-done-framework.pptx"))
+
+
+def save_reproducible(prs, path):
+    """Save *prs* with fixed zip member timestamps, so an unchanged deck is byte-identical."""
+    buf = io.BytesIO()
+    prs.save(buf)
+    with zipfile.ZipFile(buf) as src, zipfile.ZipFile(path, "w") as dst:
+        for info in src.infolist():
+            member = zipfile.ZipInfo(info.filename, (1980, 1, 1, 0, 0, 0))
+            member.compress_type = info.compress_type
+            member.external_attr = info.external_attr
+            dst.writestr(member, src.read(info))
+
+
+save_reproducible(prs, output_path)
 print(f"Presentation saved to: {output_path}")
 print(f"Total slides: {len(prs.slides)}")
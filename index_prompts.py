@@ -0,0 +1,322 @@
+"""Full-text search over the Prompt Library.
+
+Usage:
+    python index_prompts.py index
+    python index_prompts.py search "approved tech stack"
+    python index_prompts.py search "entra rbac roles" -n 5 --format json
+
+Markdown prompts, their .docx copies, the zipped bundles and .cursorrules
+files are split into sections at their headings and stored in an SQLite FTS5
+table, which is an on-disk inverted index ranked with BM25. A section that
+appears in several files (a prompt, its .docx copy, the zipped bundles) is
+stored once, together with every place it appears. Re-indexing only
+re-extracts files whose SHA-1 has changed since the last run.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import zipfile
+
+from lxml import etree
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LIBRARY = os.path.join(ROOT, "Prompt Library")
+DEFAULT_DB = os.path.join(ROOT, ".prompt-index.sqlite")
+HEADING_WEIGHT = 4.0  # bm25 weight of a section heading relative to its body
+SCHEMA_VERSION = 2
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MD_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)(\S*)")
+_RULES_HEADING = re.compile(r"^[A-Z][A-Z0-9 &/()'-]{3,}$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, sha1 TEXT NOT NULL);
+-- One row per distinct section; sections.rowid = entries.id
+CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5(
+    heading, body, tokenize = 'porter unicode61'
+);
+-- Every place a section appears
+CREATE TABLE IF NOT EXISTS copies (entry INTEGER NOT NULL, source TEXT NOT NULL, path TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS copies_entry ON copies (entry);
+CREATE INDEX IF NOT EXISTS copies_path ON copies (path);
+"""
+
+
+# ── Extraction ──
+
+def _sections(heading_lines):
+    """Group (level, heading) / (None, text) items into [(heading path, body)]."""
+    stack = []
+    sections = []
+    body = []
+
+    def flush():
+        text = "\n".join(body).strip()
+        if text or stack:
+            sections.append((" › ".join(h for _, h in stack), text))
+        body.clear()
+
+    for level, line in heading_lines:
+        if level is None:
+            body.append(line)
+            continue
+        flush()
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, line))
+    flush()
+    return [s for s in sections if s[0] or s[1]]
+
+
+def markdown_sections(text):
+    """Split markdown at ATX headings.
+
+    Headings inside untagged fences count too, since the prompts themselves
+    are pasted as untagged blocks; tagged code blocks (bash, yaml, ...) don't.
+    """
+    items = []
+    fence = None
+    for line in text.splitlines():
+        m = _FENCE.match(line)
+        if m:
+            fence = None if fence is not None else m.group(2)
+            continue
+        h = _MD_HEADING.match(line)
+        if h and not fence:
+            items.append((len(h.group(1)), h.group(2)))
+        else:
+            items.append((None, line))
+    return _sections(items)
+
+
+def docx_sections(data):
+    """Split a .docx at its Heading N paragraphs; table rows become pipe-joined lines."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        body = etree.fromstring(zf.read("word/document.xml")).find(f"{W}body")
+    items = []
+    for el in body.iter(f"{W}p", f"{W}tr"):
+        if el.tag == f"{W}tr":
+            cells = ["".join(t.text or "" for t in tc.iter(f"{W}t")) for tc in el.iter(f"{W}tc")]
+            items.append((None, " | ".join(cells)))
+            continue
+        if el.getparent().tag == f"{W}tc":
+            continue  # already emitted with its row
+        text = "".join(
+            (node.text or "") if node.tag == f"{W}t" else "\n" if node.tag == f"{W}br" else "\t"
+            for node in el.iter(f"{W}t", f"{W}br", f"{W}tab")
+        )
+        style = el.find(f"{W}pPr/{W}pStyle")
+        name = style.get(f"{W}val") if style is not None else ""
+        if name.startswith("Heading") and name[7:].isdigit():
+            items.append((int(name[7:]), text))
+        else:
+            items.append((None, text))
+    return _sections(items)
+
+
+def rules_sections(text):
+    """Split a .cursorrules file at its ALL-CAPS heading lines."""
+    items = []
+    for line in text.splitlines():
+        if _RULES_HEADING.match(line.strip()):
+            items.append((1, line.strip()))
+        else:
+            items.append((None, line))
+    return _sections(items)
+
+
+def extract(name, data):
+    """Return [(heading, body)] for one file's bytes, or [] if the type isn't indexed."""
+    base = os.path.basename(name).lower()
+    if base.endswith(".md"):
+        return markdown_sections(data.decode("utf-8", "replace"))
+    if base.endswith(".docx"):
+        return docx_sections(data)
+    if base == ".cursorrules":
+        return rules_sections(data.decode("utf-8", "replace"))
+    return []
+
+
+def extract_file(path, data):
+    """Yield (source label, heading, body) for a file, expanding zip bundles."""
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                for heading, body in extract(info.filename, zf.read(info)):
+                    yield f"{path}!{info.filename}", heading, body
+        return
+    for heading, body in extract(path, data):
+        yield path, heading, body
+
+
+def library_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            lower = name.lower()
+            if lower.endswith((".md", ".docx", ".zip")) or lower == ".cursorrules":
+                yield os.path.join(dirpath, name)
+
+
+# ── Index ──
+
+def connect(db_path):
+    """Open the index, starting it over if it was written with an older schema."""
+    conn = sqlite3.connect(db_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS entries;"
+                           "DROP TABLE IF EXISTS sections; DROP TABLE IF EXISTS copies;")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _content_key(heading, body):
+    """Hash of a section's words, so a markdown section and its .docx copy agree."""
+    words = re.findall(r"\w+", f"{heading}\n{body}".lower())
+    return hashlib.sha1(" ".join(words).encode("utf-8")).hexdigest()
+
+
+def _add_section(conn, path, source, heading, body):
+    """Record one appearance of a section, adding the section itself if it's new."""
+    key = _content_key(heading, body)
+    cur = conn.execute("INSERT OR IGNORE INTO entries (key) VALUES (?)", (key,))
+    if cur.rowcount:
+        entry = cur.lastrowid
+        conn.execute("INSERT INTO sections (rowid, heading, body) VALUES (?, ?, ?)", (entry, heading, body))
+    else:
+        entry = conn.execute("SELECT id FROM entries WHERE key = ?", (key,)).fetchone()[0]
+    conn.execute("INSERT INTO copies (entry, source, path) VALUES (?, ?, ?)", (entry, source, path))
+
+
+def build_index(conn, root=LIBRARY):
+    """Bring the index up to date with *root*; return (added, updated, removed, unchanged)."""
+    known = dict(conn.execute("SELECT path, sha1 FROM files"))
+    seen = set()
+    added = updated = unchanged = 0
+    base = os.path.dirname(os.path.abspath(root))
+    with conn:
+        for full in library_files(root):
+            path = os.path.relpath(full, base).replace(os.sep, "/")
+            seen.add(path)
+            with open(full, "rb") as f:
+                data = f.read()
+            sha1 = hashlib.sha1(data).hexdigest()
+            if known.get(path) == sha1:
+                unchanged += 1
+                continue
+            if path in known:
+                conn.execute("DELETE FROM copies WHERE path = ?", (path,))
+                updated += 1
+            else:
+                added += 1
+            for source, heading, body in extract_file(path, data):
+                _add_section(conn, path, source, heading, body)
+            conn.execute("INSERT OR REPLACE INTO files (path, sha1) VALUES (?, ?)", (path, sha1))
+        removed = [p for p in known if p not in seen]
+        for path in removed:
+            conn.execute("DELETE FROM copies WHERE path = ?", (path,))
+            conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        if updated or removed:
+            orphans = conn.execute(
+                "SELECT id FROM entries WHERE id NOT IN (SELECT entry FROM copies)").fetchall()
+            conn.executemany("DELETE FROM sections WHERE rowid = ?", orphans)
+            conn.executemany("DELETE FROM entries WHERE id = ?", orphans)
+    return added, updated, len(removed), unchanged
+
+
+def _match_expr(query, op):
+    terms = re.findall(r"\w+", query)
+    return f" {op} ".join(f'"{t}"' for t in terms)
+
+
+def search(conn, query, limit=10, raw=False):
+    """Return ranked [{source, also, heading, snippet, score}] for *query*.
+
+    Plain queries need every word to match; if nothing does, any word will do.
+    With *raw*, *query* is passed through as FTS5 syntax. Each section is
+    returned once: "source" prefers a plain file over a zip member, and the
+    other places it appears are listed under "also".
+    """
+    sql = (
+        "SELECT rowid, heading, snippet(sections, 1, '[', ']', '…', 16), "
+        f"bm25(sections, {HEADING_WEIGHT}, 1.0) AS score "
+        "FROM sections WHERE sections MATCH ? ORDER BY score LIMIT ?"
+    )
+    exprs = [query] if raw else [_match_expr(query, "AND"), _match_expr(query, "OR")]
+    rows = []
+    for expr in exprs:
+        if not expr:
+            continue
+        rows = conn.execute(sql, (expr, limit)).fetchall()
+        if rows:
+            break
+    sources = {}
+    marks = ", ".join("?" * len(rows))
+    for entry, source in conn.execute(
+            f"SELECT entry, source FROM copies WHERE entry IN ({marks})", [r[0] for r in rows]):
+        sources.setdefault(entry, []).append(source)
+    results = []
+    for entry, heading, snippet, score in rows:
+        source, *also = sorted(sources[entry], key=lambda s: ("!" in s, s))
+        results.append({"source": source, "also": also, "heading": heading,
+                        "snippet": snippet, "score": round(-score, 3)})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help="index file (default: %(default)s)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    index_cmd = sub.add_parser("index", help="add new and changed files to the index")
+    index_cmd.add_argument("--root", default=LIBRARY)
+    search_cmd = sub.add_parser("search", help="query the index")
+    search_cmd.add_argument("query")
+    search_cmd.add_argument("-n", "--limit", type=int, default=10)
+    search_cmd.add_argument("--raw", action="store_true", help="treat the query as FTS5 syntax")
+    search_cmd.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    fresh = conn.execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+    if args.command == "index" or fresh:
+        start = time.perf_counter()
+        counts = build_index(conn, getattr(args, "root", LIBRARY))
+        print("indexed: {} added, {} updated, {} removed, {} unchanged".format(*counts)
+              + f" in {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
+        if args.command == "index":
+            return 0
+
+    start = time.perf_counter()
+    try:
+        results = search(conn, args.query, args.limit, args.raw)
+    except sqlite3.OperationalError as exc:
+        search_cmd.error(f"bad query {args.query!r}: {exc}")
+    elapsed = (time.perf_counter() - start) * 1000
+    if args.format == "json":
+        json.dump(results, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        for i, r in enumerate(results, 1):
+            print(f"{i:2}. {r['source']}  [{r['score']}]")
+            print(f"    {r['heading']}")
+            print(f"    {' '.join(r['snippet'].split())}")
+            if r["also"]:
+                print(f"    also in: {', '.join(r['also'])}")
+        print(f"{len(results)} results in {elapsed:.1f} ms", file=sys.stderr)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
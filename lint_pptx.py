@@ -0,0 +1,295 @@
+"""Lint a built deck for off-slide shapes, overlapping text and low-contrast text.
+
+Usage:
+    python lint_pptx.py get-shit-done-framework.pptx
+    python lint_pptx.py deck.pptx --format json --strict
+
+Exits non-zero when any error is found (or any warning, with --strict), so it
+can gate CI. Only the presentation and slide parts are read.
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import sys
+import zipfile
+from typing import NamedTuple
+
+import numpy as np
+
+from pptx_parts import NS, iter_shapes, paragraphs, parse, slide_partnames, slide_size
+
+EMU_PER_INCH = 914400
+# WCAG 2.x AA thresholds; "large" is >= 18pt, or >= 14pt bold
+MIN_CONTRAST = 4.5
+MIN_CONTRAST_LARGE = 3.0
+DEFAULT_FONT_SIZE = 1800  # hundredths of a point
+
+
+class Issue(NamedTuple):
+    slide: int
+    shape_id: int
+    shape: str
+    rule: str
+    severity: str
+    message: str
+
+
+class _Shape(NamedTuple):
+    z: int
+    shape_id: int
+    name: str
+    left: int
+    top: int
+    right: int
+    bottom: int
+    fill: str
+    el: object
+
+
+# ── Colour contrast ──
+
+def _luminance(hex_color):
+    rgb = np.array([int(hex_color[i:i + 2], 16) for i in (0, 2, 4)]) / 255.0
+    linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return float(linear @ np.array([0.2126, 0.7152, 0.0722]))
+
+
+def contrast_ratio(fg, bg):
+    """WCAG contrast ratio between two RRGGBB hex colours, from 1.0 to 21.0."""
+    hi, lo = sorted((_luminance(fg), _luminance(bg)), reverse=True)
+    return (hi + 0.05) / (lo + 0.05)
+
+
+def _srgb(el, path):
+    clr = el.find(path, NS)
+    return clr.get("val").upper() if clr is not None else None
+
+
+def _runs(el):
+    """Yield (colour, size, bold) for each non-empty run in a shape's text body."""
+    for p in el.iterfind("p:txBody/a:p", NS):
+        def_rpr = p.find("a:pPr/a:defRPr", NS)
+        for r in p.iterfind("a:r", NS):
+            t = r.find("a:t", NS)
+            if t is None or not (t.text or "").strip():
+                continue
+            rpr = r.find("a:rPr", NS)
+            color = size = bold = None
+            for props in (rpr, def_rpr):
+                if props is None:
+                    continue
+                color = color or _srgb(props, "a:solidFill/a:srgbClr")
+                size = size or props.get("sz")
+                bold = bold or props.get("b")
+            yield color, int(size or DEFAULT_FONT_SIZE), bold in ("1", "true")
+
+
+# ── Spatial checks ──
+
+class _IntervalIndex:
+    """Dynamic set of half-open y-intervals over a fixed, sorted coordinate list.
+
+    A segment tree over the elementary slabs between coordinates. Each interval
+    is stored in the O(log n) nodes that exactly cover it (for stabbing
+    queries) and counted at the leaf where it starts (for range queries), so
+    inserts and deletes cost O(log n) and a query costs O(log n) per result.
+    """
+
+    def __init__(self, coords):
+        self._coords = coords
+        self._size = 1
+        while self._size < max(len(coords), 1):
+            self._size *= 2
+        self._cover = [set() for _ in range(2 * self._size)]
+        self._starts = [set() for _ in range(self._size)]
+        self._count = [0] * (2 * self._size)
+
+    def _slab(self, y):
+        return bisect.bisect_left(self._coords, y)
+
+    def _update(self, key, top, bottom, add):
+        lo, hi = self._slab(top), self._slab(bottom)
+        touch = set.add if add else set.remove
+        # Canonical cover of leaves [lo, hi)
+        l, r = lo + self._size, hi + self._size
+        while l < r:
+            if l & 1:
+                touch(self._cover[l], key)
+                l += 1
+            if r & 1:
+                r -= 1
+                touch(self._cover[r], key)
+            l, r = l // 2, r // 2
+        touch(self._starts[lo], key)
+        node = lo + self._size
+        while node:
+            self._count[node] += 1 if add else -1
+            node //= 2
+
+    def add(self, key, top, bottom):
+        self._update(key, top, bottom, True)
+
+    def remove(self, key, top, bottom):
+        self._update(key, top, bottom, False)
+
+    def overlapping(self, top, bottom):
+        """Keys of stored intervals [t, b) with t < bottom and b > top."""
+        lo, hi = self._slab(top), self._slab(bottom)
+        # Intervals containing *top*: t <= top < b
+        node = lo + self._size
+        while node:
+            yield from self._cover[node]
+            node //= 2
+        # Intervals starting strictly inside (top, bottom)
+        if lo + 1 < hi:
+            yield from self._starts_in(1, 0, self._size, lo + 1, hi)
+
+    def _starts_in(self, node, node_lo, node_hi, lo, hi):
+        if node_hi <= lo or hi <= node_lo or not self._count[node]:
+            return
+        if node >= self._size:
+            yield from self._starts[node - self._size]
+            return
+        mid = (node_lo + node_hi) // 2
+        yield from self._starts_in(2 * node, node_lo, mid, lo, hi)
+        yield from self._starts_in(2 * node + 1, mid, node_hi, lo, hi)
+
+
+def find_overlaps(boxes):
+    """Return index pairs of boxes (left, top, right, bottom) whose interiors intersect.
+
+    Sweeps left to right, keeping the boxes that span the sweep line in an
+    interval index keyed by their y-extent, so each box is matched only
+    against boxes that really overlap it: O((n + k) log n) for k pairs.
+    Boxes with zero width or height have no interior and never overlap.
+    """
+    live = [i for i, (l, t, r, b) in enumerate(boxes) if r > l and b > t]
+    coords = sorted({y for i in live for y in (boxes[i][1], boxes[i][3])})
+    index = _IntervalIndex(coords)
+    expiry = []  # heap of (right, index)
+    pairs = []
+    for i in sorted(live, key=lambda i: boxes[i][0]):
+        left, top, right, bottom = boxes[i]
+        while expiry and expiry[0][0] <= left:
+            _, j = heapq.heappop(expiry)
+            index.remove(j, boxes[j][1], boxes[j][3])
+        for j in index.overlapping(top, bottom):
+            pairs.append((min(i, j), max(i, j)))
+        heapq.heappush(expiry, (right, i))
+        index.add(i, top, bottom)
+    return pairs
+
+
+def _inches(emu):
+    return f"{emu / EMU_PER_INCH:.2f}in"
+
+
+def lint_slide(index, sld, width, height, margin):
+    shapes = []
+    for z, (el, shape_id, name, (left, top, w, h)) in enumerate(iter_shapes(sld)):
+        fill = _srgb(el, "p:spPr/a:solidFill/a:srgbClr")
+        shapes.append(_Shape(z, shape_id, name, left, top, left + w, top + h, fill, el))
+    texts = [s for s in shapes if any(t.strip() for t in paragraphs(s.el))]
+    issues = []
+
+    def issue(shape, rule, severity, message):
+        issues.append(Issue(index, shape.shape_id, shape.name, rule, severity, message))
+
+    for s in shapes:
+        if s.left < 0 or s.top < 0 or s.right > width or s.bottom > height:
+            issue(s, "off-slide", "error",
+                  f"extends outside the {_inches(width)} x {_inches(height)} slide")
+    for s in texts:
+        gaps = {"left": s.left, "top": s.top, "right": width - s.right, "bottom": height - s.bottom}
+        edge, gap = min(gaps.items(), key=lambda kv: kv[1])
+        if 0 <= gap < margin:
+            issue(s, "near-edge", "warning", f"text is {_inches(gap)} from the {edge} edge")
+
+    boxes = [(s.left, s.top, s.right, s.bottom) for s in texts]
+    for i, j in find_overlaps(boxes):
+        a, b = sorted((texts[i], texts[j]))
+        issue(b, "text-overlap", "warning", f"text overlaps {a.name!r} (id {a.shape_id})")
+
+    issues.extend(_contrast_issues(index, sld, shapes, texts))
+    return issues, len(shapes)
+
+
+def _contrast_issues(index, sld, shapes, texts):
+    slide_bg = _srgb(sld, "p:cSld/p:bg/p:bgPr/a:solidFill/a:srgbClr")
+    filled = [s for s in shapes if s.fill]
+    if filled:
+        f = np.array([(s.left, s.top, s.right, s.bottom, s.z) for s in filled])
+    issues = []
+    for s in texts:
+        bg = s.fill
+        if bg is None and filled:
+            cx, cy = (s.left + s.right) / 2, (s.top + s.bottom) / 2
+            under = (f[:, 0] <= cx) & (cx <= f[:, 2]) & (f[:, 1] <= cy) & (cy <= f[:, 3]) & (f[:, 4] < s.z)
+            if under.any():
+                bg = filled[int(np.flatnonzero(under)[-1])].fill
+        bg = bg or slide_bg
+        if bg is None:
+            continue
+        worst = None
+        for color, size, bold in _runs(s.el):
+            if color is None:
+                continue
+            large = size >= 1800 or (bold and size >= 1400)
+            ratio = contrast_ratio(color, bg)
+            needed = MIN_CONTRAST_LARGE if large else MIN_CONTRAST
+            if ratio < needed and (worst is None or ratio < worst[0]):
+                worst = (ratio, needed, color)
+        if worst:
+            ratio, needed, color = worst
+            issues.append(Issue(index, s.shape_id, s.name, "low-contrast", "error",
+                                f"#{color} on #{bg} has contrast {ratio:.2f}:1, needs {needed}:1"))
+    return issues
+
+
+def lint(path, margin=int(0.25 * EMU_PER_INCH)):
+    """Return (issues, slide count, shape count) for the deck at *path*."""
+    with zipfile.ZipFile(path) as zf:
+        width, height = slide_size(zf)
+        issues = []
+        n_shapes = 0
+        partnames = slide_partnames(zf)
+        for index, partname in enumerate(partnames, 1):
+            slide_issues, count = lint_slide(index, parse(zf, partname), width, height, margin)
+            issues.extend(slide_issues)
+            n_shapes += count
+    return issues, len(partnames), n_shapes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("deck")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--margin", type=float, default=0.25,
+                        help="warn when text sits closer than this to a slide edge (inches)")
+    parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    args = parser.parse_args(argv)
+
+    issues, n_slides, n_shapes = lint(args.deck, int(args.margin * EMU_PER_INCH))
+    counts = {"error": 0, "warning": 0}
+    for i in issues:
+        counts[i.severity] += 1
+
+    if args.format == "json":
+        json.dump({"deck": args.deck, "slides": n_slides, "shapes": n_shapes,
+                   "summary": counts, "issues": [i._asdict() for i in issues]},
+                  sys.stdout, indent=2)
+        print()
+    else:
+        for i in issues:
+            print(f"slide {i.slide}: {i.severity} {i.rule}: {i.shape!r} (id {i.shape_id}) {i.message}")
+        print(f"{n_slides} slides, {n_shapes} shapes: "
+              f"{counts['error']} errors, {counts['warning']} warnings")
+
+    failed = counts["error"] or (args.strict and counts["warning"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""Patch text in an existing deck without regenerating it.
+
+Usage:
+    python patch_pptx.py get-shit-done-framework.pptx -r "v1.11" "v1.12"
+    python patch_pptx.py deck.pptx --slide 14 -r "discord.gg/old" "discord.gg/new"
+    python patch_pptx.py deck.pptx --slide 1 --shape "TextBox 4" --set "New footer"
+    python patch_pptx.py deck.pptx -r OLD NEW --notes -o patched.pptx
+    python patch_pptx.py deck.pptx --slide 2 --shape 3 --shape-in-notes --set "New notes"
+
+Only slide (and, with --notes, notes) parts that contain a match are parsed
+and rewritten. Every other zip member is copied byte for byte, compressed
+data included, so unchanged parts stay identical and nothing is recompressed.
+"""
+
+import argparse
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import zipfile
+import zlib
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from pptx_parts import NS, notes_partname, slide_partnames
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+_TAG = re.compile(rb"<[^>]+>")
+
+
+# ── Text replacement ──
+
+def _replace_in_paragraph(p, old, new):
+    """Replace *old* with *new* in paragraph *p*, even where *old* spans several runs.
+
+    The replacement takes the formatting of the run the match starts in.
+    Returns the number of replacements made.
+    """
+    runs = p.findall("a:r/a:t", NS)
+    count = 0
+    resume = 0
+    while True:
+        text = "".join(t.text or "" for t in runs)
+        start = text.find(old, resume)
+        if start < 0:
+            break
+        end = start + len(old)
+        pos = 0
+        placed = False
+        for t in runs:
+            chunk = t.text or ""
+            lo, hi = pos, pos + len(chunk)
+            pos = hi
+            if hi <= start or lo >= end:
+                continue
+            keep_head = chunk[:max(start - lo, 0)]
+            keep_tail = chunk[max(end - lo, 0):] if hi >= end else ""
+            t.text = keep_head + (new if not placed else "") + keep_tail
+            placed = True
+        resume = start + len(new)
+        count += 1
+    return count
+
+
+def _set_shape_text(sp, text):
+    """Make *text* the only content of *sp*, keeping the first run's formatting."""
+    paras = sp.findall("p:txBody/a:p", NS)
+    if not paras:
+        return 0
+    first = paras[0]
+    run = first.find("a:r", NS)
+    if run is None:
+        return 0
+    for extra in paras[1:]:
+        extra.getparent().remove(extra)
+    keep = (f"{{{NS['a']}}}pPr", f"{{{NS['a']}}}endParaRPr")
+    for child in list(first):
+        if child.tag not in keep:
+            first.remove(child)
+    run.find("a:t", NS).text = text
+    end = first.find("a:endParaRPr", NS)
+    if end is None:
+        first.append(run)
+    else:
+        end.addprevious(run)
+    return 1
+
+
+def _patch_part(root, replacements, shape, set_text):
+    """Apply the edits to a parsed slide or notes part; return the number of changes."""
+    sp_tree = root.find("p:cSld/p:spTree", NS)
+    targets = [sp_tree]
+    if shape is not None:
+        targets = [
+            el for el in sp_tree.iter(f"{{{NS['p']}}}sp")
+            if _shape_matches(el.find("p:nvSpPr/p:cNvPr", NS), shape)
+        ]
+    count = 0
+    for target in targets:
+        if set_text is not None:
+            count += _set_shape_text(target, set_text)
+            continue
+        for p in target.iter(f"{{{NS['a']}}}p"):
+            for old, new in replacements:
+                count += _replace_in_paragraph(p, old, new)
+    return count
+
+
+def _shape_matches(c_nv_pr, shape):
+    return c_nv_pr is not None and shape in (c_nv_pr.get("name"), c_nv_pr.get("id"))
+
+
+def _may_contain(xml, needles):
+    """Cheap pre-check on raw part bytes; a superset of the parts that really match."""
+    text = _TAG.sub(b"", xml)
+    return any(escape(n).encode("utf-8") in text for n in needles)
+
+
+# ── Raw zip rewriting ──
+
+def _central_directory(fp):
+    """Return [(name, raw central directory record)] for the zip open as *fp*."""
+    fp.seek(0, os.SEEK_END)
+    size = fp.tell()
+    fp.seek(max(0, size - 65536 - _END_RECORD.size))
+    tail = fp.read()
+    at = tail.rfind(b"PK\x05\x06")
+    if at < 0:
+        raise ValueError("not a zip file")
+    _, _, _, _, entries, cd_size, cd_offset, _ = _END_RECORD.unpack_from(tail, at)
+    if entries == 0xFFFF or cd_offset == 0xFFFFFFFF:
+        raise ValueError("zip64 packages are not supported")
+    fp.seek(cd_offset)
+    cd = fp.read(cd_size)
+    records = []
+    pos = 0
+    for _ in range(entries):
+        fields = _CENTRAL_HEADER.unpack_from(cd, pos)
+        name_len, extra_len, comment_len = fields[10:13]
+        end = pos + _CENTRAL_HEADER.size + name_len + extra_len + comment_len
+        name = cd[pos + _CENTRAL_HEADER.size:pos + _CENTRAL_HEADER.size + name_len]
+        records.append((name.decode("utf-8" if fields[3] & 0x800 else "cp437"), cd[pos:end]))
+        pos = end
+    return records
+
+
+def _read_member(fp, record):
+    """Return (raw local header, compressed data, data descriptor) for a central record."""
+    fields = _CENTRAL_HEADER.unpack_from(record)
+    flags, csize, offset = fields[3], fields[8], fields[16]
+    fp.seek(offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    name_len, extra_len = _LOCAL_HEADER.unpack(header)[9:11]
+    header += fp.read(name_len + extra_len)
+    data = fp.read(csize)
+    descriptor = b""
+    if flags & 0x8:
+        descriptor = fp.read(4)
+        descriptor += fp.read(12 if descriptor == _DATA_DESCRIPTOR_SIG else 8)
+    return header, data, descriptor
+
+
+def rewrite_zip(src_path, dst_path, replaced):
+    """Copy *src_path* to *dst_path*, swapping in new bytes for the members in *replaced*.
+
+    Untouched members keep their local header, compressed data and central
+    directory record verbatim; only their offsets move.
+    """
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        central = []
+        for name, record in _central_directory(src):
+            header, data, descriptor = _read_member(src, record)
+            offset = dst.tell()
+            if name in replaced:
+                raw = replaced[name]
+                compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+                data = compressor.compress(raw) + compressor.flush()
+                crc = zlib.crc32(raw)
+                descriptor = b""
+                local = list(_LOCAL_HEADER.unpack_from(header))
+                local[2] &= ~0x8
+                local[3] = zipfile.ZIP_DEFLATED
+                local[6:9] = [crc, len(data), len(raw)]
+                header = _LOCAL_HEADER.pack(*local) + header[_LOCAL_HEADER.size:]
+                fields = list(_CENTRAL_HEADER.unpack_from(record))
+                fields[3] &= ~0x8
+                fields[4] = zipfile.ZIP_DEFLATED
+                fields[7:10] = [crc, len(data), len(raw)]
+            else:
+                fields = list(_CENTRAL_HEADER.unpack_from(record))
+            fields[16] = offset
+            central.append(_CENTRAL_HEADER.pack(*fields) + record[_CENTRAL_HEADER.size:])
+            dst.write(header)
+            dst.write(data)
+            dst.write(descriptor)
+        cd_offset = dst.tell()
+        for record in central:
+            dst.write(record)
+        cd_size = dst.tell() - cd_offset
+        dst.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, len(central), len(central),
+                                   cd_size, cd_offset, 0))
+
+
+def patch(path, replacements=(), slides=None, shape=None, set_text=None, notes=False,
+          output=None, shape_in_notes=False):
+    """Patch the deck at *path* and return {slide number: changes} for the parts touched.
+
+    Replacements apply to slides, and to speaker notes too when *notes* is set.
+    *shape* and *set_text* apply to the slide itself, or only to its notes
+    with *shape_in_notes*, since shape names and ids are only unique per part.
+    Writes to *output*, or atomically back over *path* when no output is given.
+    Nothing is written when nothing matched.
+    """
+    needles = [old for old, _ in replacements]
+    if any(not old for old in needles):
+        raise ValueError("replacement text to find must not be empty")
+    if set_text is not None and (shape is None or not slides or len(slides) != 1):
+        raise ValueError("setting shape text needs a shape and exactly one slide")
+    if set_text is not None and replacements:
+        raise ValueError("setting shape text can't be combined with replacements")
+    replaced = {}
+    report = {}
+    with zipfile.ZipFile(path) as zf:
+        for index, partname in enumerate(slide_partnames(zf), 1):
+            if slides and index not in slides:
+                continue
+            parts = [] if shape_in_notes else [(partname, shape)]
+            if notes or shape_in_notes:
+                notes_part = notes_partname(zf, partname)
+                if notes_part:
+                    parts.append((notes_part, shape if shape_in_notes else None))
+            for part, part_shape in parts:
+                part_set = set_text if part_shape is not None else None
+                if part_set is None and not replacements:
+                    continue
+                xml = zf.read(part)
+                if part_set is None and not _may_contain(xml, needles):
+                    continue
+                root = etree.fromstring(xml)
+                count = _patch_part(root, replacements, part_shape, part_set)
+                if count:
+                    replaced[part] = etree.tostring(root, xml_declaration=True,
+                                                    encoding="UTF-8", standalone=True)
+                    report[index] = report.get(index, 0) + count
+    if not replaced:
+        return report
+
+    if output is not None:
+        rewrite_zip(path, output, replaced)
+        return report
+    fd, tmp = tempfile.mkstemp(suffix=".pptx", dir=os.path.dirname(os.path.abspath(path)))
+    os.close(fd)
+    try:
+        rewrite_zip(path, tmp, replaced)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("deck")
+    parser.add_argument("-r", "--replace", nargs=2, action="append", default=[],
+                        metavar=("OLD", "NEW"), help="replace every occurrence of OLD with NEW")
+    parser.add_argument("--slide", type=int, action="append",
+                        help="only patch this slide number (repeatable)")
+    parser.add_argument("--shape", help="only patch the shape with this name or id")
+    parser.add_argument("--set", dest="set_text", metavar="TEXT",
+                        help="replace the whole text of --shape with TEXT")
+    parser.add_argument("--notes", action="store_true", help="apply --replace to speaker notes as well")
+    parser.add_argument("--shape-in-notes", action="store_true",
+                        help="look --shape up in the speaker notes instead of on the slide")
+    parser.add_argument("-o", "--output", help="write here instead of patching in place")
+    args = parser.parse_args(argv)
+
+    if any(not old for old, _ in args.replace):
+        parser.error("OLD must not be empty")
+    if args.set_text is not None and args.shape is None:
+        parser.error("--set needs --shape")
+    if args.set_text is not None and (not args.slide or len(args.slide) != 1):
+        parser.error("--set needs exactly one --slide, as shape names repeat across slides")
+    if args.set_text is not None and args.replace:
+        parser.error("--set can't be combined with --replace; run them separately")
+    if args.shape_in_notes and args.shape is None:
+        parser.error("--shape-in-notes needs --shape")
+    if not args.replace and args.set_text is None:
+        parser.error("nothing to do: give --replace OLD NEW or --shape NAME --set TEXT")
+
+    report = patch(args.deck, args.replace, args.slide, args.shape, args.set_text,
+                   args.notes, args.output, args.shape_in_notes)
+    if not report:
+        print("no matches; deck left unchanged")
+        return 1
+    for index, count in sorted(report.items()):
+        print(f"slide {index}: {count} change(s)")
+    print(f"Patched deck saved to: {args.output or args.deck}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
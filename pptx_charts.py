@@ -0,0 +1,150 @@
+"""Native, data-driven chart helpers for the GSD presentation."""
+
+import datetime
+
+import numpy as np
+from pptx.chart.data import CategoryChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_MARKER_STYLE
+from pptx.util import Pt
+
+CHART_TYPES = {
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "line": XL_CHART_TYPE.LINE,
+    "area": XL_CHART_TYPE.AREA,
+}
+# Stamped into the embedded workbook so the same data always gives the same bytes
+WORKBOOK_DATE = datetime.datetime(2000, 1, 1)
+
+
+class _BulkWorkbookWriter(CategoryWorkbookWriter):
+    """Writes the embedded workbook one column at a time instead of one cell at a time."""
+
+    def _populate_worksheet(self, workbook, worksheet):
+        chart_data = self._chart_data
+        workbook.set_properties({"created": WORKBOOK_DATE})
+        cat_format = workbook.add_format({"num_format": chart_data.categories.number_format})
+        worksheet.set_column(0, 0, 10)
+        worksheet.write_column(1, 0, chart_data._labels, cat_format)
+        worksheet.write_row(0, 1, [series.name for series in chart_data])
+        for idx, series in enumerate(chart_data):
+            num_format = workbook.add_format({"num_format": series.number_format})
+            worksheet.write_column(1, idx + 1, chart_data._columns[idx], num_format)
+
+
+class ArrayChartData(CategoryChartData):
+    """Single-level category chart data built straight from arrays."""
+
+    def __init__(self, categories, series, number_format="General"):
+        super().__init__(number_format)
+        self._labels = _as_cells(categories)
+        self._columns = []
+        self.categories = self._labels
+        for name, values in _iter_series(series):
+            column = _as_cells(values)
+            if len(column) != len(self._labels):
+                raise ValueError(
+                    f"series {name!r} has {len(column)} values, expected {len(self._labels)}"
+                )
+            self._columns.append(column)
+            self.add_series(name, column)
+
+    @property
+    def _workbook_writer(self):
+        return _BulkWorkbookWriter(self)
+
+
+def _as_cells(values):
+    """Convert an array-like to a list of Python scalars, mapping NaN to None (a gap)."""
+    arr = np.asarray(values)
+    if arr.ndim != 1:
+        raise ValueError(f"expected a 1-D sequence, got shape {arr.shape}")
+    if arr.dtype.kind == "f":
+        mask = np.isnan(arr)
+        if mask.any():
+            return np.where(mask, None, arr.astype(object)).tolist()
+    return arr.tolist()
+
+
+def _iter_series(series):
+    """Yield (name, values) from a mapping, a list of pairs, a 2-D array or a single 1-D array."""
+    if hasattr(series, "items"):
+        yield from series.items()
+        return
+    if isinstance(series, (list, tuple)) and series and isinstance(series[0], tuple):
+        yield from series
+        return
+    arr = np.asarray(series)
+    if arr.ndim == 1:
+        yield "Series 1", arr
+    else:
+        for i, row in enumerate(arr):
+            yield f"Series {i + 1}", row
+
+
+def add_chart(slide, left, top, width, height, categories, series, kind="bar",
+              colors=None, point_colors=None, font_size=12, font_color=None,
+              number_format="General", legend=None, gap_width=None):
+    """Add a native bar, column, line or area chart to *slide* and return the chart.
+
+    Styling is applied per series (or per point when *point_colors* is given),
+    so the cost of plotting thousands of points is dominated by the data itself.
+    """
+    if kind not in CHART_TYPES:
+        raise ValueError(f"kind must be one of {tuple(CHART_TYPES)}, got {kind!r}")
+    chart_data = ArrayChartData(categories, series, number_format)
+    frame = slide.shapes.add_chart(CHART_TYPES[kind], left, top, width, height, chart_data)
+    chart = frame.chart
+
+    chart.font.size = Pt(font_size)
+    if font_color is not None:
+        chart.font.color.rgb = font_color
+
+    if legend is None:
+        legend = len(chart_data) > 1
+    chart.has_legend = legend
+    if legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+
+    value_axis = chart.value_axis
+    value_axis.has_major_gridlines = False
+    value_axis.visible = False
+    category_axis = chart.category_axis
+    category_axis.format.line.fill.background()
+    if kind == "bar":
+        # Horizontal bars list categories bottom-up by default; read top-down like the slides
+        category_axis.reverse_order = True
+
+    plot = chart.plots[0]
+    if gap_width is not None and kind in ("bar", "column"):
+        plot.gap_width = gap_width
+
+    for i, chart_series in enumerate(plot.series):
+        if colors is not None:
+            _style_series(chart_series, colors[i % len(colors)], kind)
+        if kind == "line":
+            chart_series.smooth = False
+            chart_series.marker.style = XL_MARKER_STYLE.NONE
+
+    if point_colors is not None:
+        points = plot.series[0].points
+        for j, color in enumerate(point_colors):
+            fill = points[j].format.fill
+            fill.solid()
+            fill.fore_color.rgb = color
+
+    return chart
+
+
+def _style_series(chart_series, color, kind):
+    if kind == "line":
+        chart_series.format.line.color.rgb = color
+        chart_series.format.line.width = Pt(2)
+        return
+    fill = chart_series.format.fill
+    fill.solid()
+    fill.fore_color.rgb = color
+    chart_series.format.line.fill.background()
+
@@ -0,0 +1,130 @@
+"""Vectorised grid, row, column and flow layouts for groups of slide shapes."""
+
+from typing import NamedTuple
+
+import numpy as np
+from pptx.util import Emu
+
+ALIGNMENTS = ("start", "center", "end")
+
+
+class Box(NamedTuple):
+    """Position and size of one shape, in EMU, ready to splat into the add_* helpers."""
+
+    left: Emu
+    top: Emu
+    width: Emu
+    height: Emu
+
+    @property
+    def right(self):
+        return Emu(self.left + self.width)
+
+    @property
+    def bottom(self):
+        return Emu(self.top + self.height)
+
+    def inset(self, dx, dy=None):
+        """Shrink the box by *dx* on the left/right and *dy* (default *dx*) on the top/bottom."""
+        dy = dx if dy is None else dy
+        return Box(Emu(self.left + dx), Emu(self.top + dy),
+                   Emu(self.width - 2 * dx), Emu(self.height - 2 * dy))
+
+    def offset(self, dx=0, dy=0):
+        return Box(Emu(self.left + dx), Emu(self.top + dy), self.width, self.height)
+
+
+def _to_boxes(lefts, tops, widths, heights):
+    cols = np.broadcast_arrays(lefts, tops, widths, heights)
+    table = np.rint(np.stack(cols, axis=1)).astype(np.int64).tolist()
+    return [Box(Emu(l), Emu(t), Emu(w), Emu(h)) for l, t, w, h in table]
+
+
+def _track(count, start, extent, size, gap, padding, align):
+    """Solve one axis: return (offsets, size) for *count* equal tracks.
+
+    With no *size* the tracks stretch to fill *extent*; with no *extent* the
+    container shrinks to fit. When both are given, *align* places the slack.
+    """
+    if align not in ALIGNMENTS:
+        raise ValueError(f"align must be one of {ALIGNMENTS}, got {align!r}")
+    if size is None and extent is None:
+        raise ValueError("need either a container extent or an item size")
+    gaps = gap * max(count - 1, 0)
+    if size is None:
+        size = (extent - 2 * padding - gaps) / count
+    shift = 0
+    if extent is not None:
+        slack = extent - 2 * padding - (count * size + gaps)
+        shift = {"start": 0, "center": slack / 2, "end": slack}[align]
+    offsets = start + padding + shift + np.arange(count) * (size + gap)
+    return offsets, size
+
+
+def grid(n, cols, left, top, width=None, height=None, item_width=None, item_height=None,
+         gap=0, row_gap=None, padding=0, align="start", valign="start"):
+    """Lay *n* items out row-major in a grid of *cols* columns.
+
+    Items are equal-width (and equal-height) cells; pass *width*/*height* to fill
+    a container, *item_width*/*item_height* to fix the cell size, or both to
+    align fixed cells inside a container.
+    """
+    if n == 0:
+        return []
+    cols = min(cols, n)
+    rows = -(-n // cols)
+    row_gap = gap if row_gap is None else row_gap
+    xs, w = _track(cols, left, width, item_width, gap, padding, align)
+    ys, h = _track(rows, top, height, item_height, row_gap, padding, valign)
+    idx = np.arange(n)
+    return _to_boxes(xs[idx % cols], ys[idx // cols], w, h)
+
+
+def row(n, left, top, width=None, height=None, item_width=None, gap=0, padding=0,
+        align="start"):
+    """Lay *n* items out left to right, e.g. a row of equal-width cards."""
+    return grid(n, n, left, top, width, height, item_width, None,
+                gap=gap, padding=padding, align=align)
+
+
+def column(n, left, top, width=None, height=None, item_height=None, gap=0, padding=0,
+           valign="start"):
+    """Lay *n* items out top to bottom, e.g. a numbered list of steps."""
+    return grid(n, 1, left, top, width, height, None, item_height,
+                gap=gap, padding=padding, valign=valign)
+
+
+def flow(widths, left, top, width, item_height, gap=0, row_gap=None, padding=0,
+         align="start"):
+    """Wrap items of varying *widths* into as many lines as needed inside *width*.
+
+    Each line is filled greedily; a single item wider than the container gets a
+    line of its own.
+    """
+    widths = np.asarray(widths, dtype=np.float64)
+    n = len(widths)
+    if n == 0:
+        return []
+    if align not in ALIGNMENTS:
+        raise ValueError(f"align must be one of {ALIGNMENTS}, got {align!r}")
+    row_gap = gap if row_gap is None else row_gap
+    inner = width - 2 * padding
+
+    # ends[i] is the right edge of item i if every item sat on one endless line
+    ends = np.cumsum(widths + gap) - gap
+    starts = ends - widths
+    line_starts = []
+    i = 0
+    while i < n:
+        line_starts.append(i)
+        j = int(np.searchsorted(ends, starts[i] + inner, side="right"))
+        i = max(j, i + 1)
+    line_starts = np.asarray(line_starts)
+    line_ends = np.append(line_starts[1:], n) - 1
+
+    line_of = np.repeat(np.arange(len(line_starts)), np.diff(np.append(line_starts, n)))
+    slack = inner - (ends[line_ends] - starts[line_starts])
+    shift = {"start": np.zeros_like(slack), "center": slack / 2, "end": slack}[align]
+    xs = left + padding + starts - starts[line_starts][line_of] + shift[line_of]
+    ys = top + padding + line_of * (item_height + row_gap)
+    return _to_boxes(xs, ys, widths, item_height)
@@ -0,0 +1,105 @@
+"""Read individual parts of a .pptx package without loading the whole presentation."""
+
+import posixpath
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+RT_SLIDE = RT + "slide"
+RT_NOTES_SLIDE = RT + "notesSlide"
+PRESENTATION = "ppt/presentation.xml"
+
+# Top-level shape elements of a p:spTree, and where each keeps its a:xfrm
+SHAPE_TAGS = {
+    f"{{{NS['p']}}}sp": "p:spPr/a:xfrm",
+    f"{{{NS['p']}}}pic": "p:spPr/a:xfrm",
+    f"{{{NS['p']}}}cxnSp": "p:spPr/a:xfrm",
+    f"{{{NS['p']}}}graphicFrame": "p:xfrm",
+    f"{{{NS['p']}}}grpSp": "p:grpSpPr/a:xfrm",
+}
+
+
+def parse(zf, partname):
+    return etree.fromstring(zf.read(partname))
+
+
+def rels_partname(partname):
+    head, tail = posixpath.split(partname)
+    return posixpath.join(head, "_rels", tail + ".rels")
+
+
+def read_rels(zf, partname):
+    """Return {rId: (reltype, target partname)} for *partname*, or {} if it has no rels."""
+    name = rels_partname(partname)
+    if name not in zf.NameToInfo:
+        return {}
+    base = posixpath.dirname(partname)
+    rels = {}
+    for rel in parse(zf, name).iterfind("rel:Relationship", NS):
+        target = rel.get("Target")
+        if rel.get("TargetMode") != "External":
+            target = posixpath.normpath(posixpath.join(base, target))
+        rels[rel.get("Id")] = (rel.get("Type"), target)
+    return rels
+
+
+def slide_partnames(zf):
+    """Slide partnames in presentation order."""
+    rels = read_rels(zf, PRESENTATION)
+    ids = parse(zf, PRESENTATION).iterfind("p:sldIdLst/p:sldId", NS)
+    return [rels[sld_id.get(f"{{{NS['r']}}}id")][1] for sld_id in ids]
+
+
+def notes_partname(zf, slide_partname):
+    for reltype, target in read_rels(zf, slide_partname).values():
+        if reltype == RT_NOTES_SLIDE:
+            return target
+    return None
+
+
+def slide_size(zf):
+    sld_sz = parse(zf, PRESENTATION).find("p:sldSz", NS)
+    return int(sld_sz.get("cx")), int(sld_sz.get("cy"))
+
+
+def iter_shapes(sld):
+    """Yield (element, shape_id, name, (left, top, width, height)) for top-level shapes.
+
+    Group shapes are reported as a single box; shapes without an explicit
+    transform (e.g. inherited placeholders) are skipped.
+    """
+    sp_tree = sld.find("p:cSld/p:spTree", NS)
+    for el in sp_tree:
+        path = SHAPE_TAGS.get(el.tag)
+        if path is None:
+            continue
+        xfrm = el.find(path, NS)
+        if xfrm is None:
+            continue
+        off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+        if off is None or ext is None:
+            continue
+        c_nv_pr = el.find("*/p:cNvPr", NS)
+        bbox = (int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")))
+        yield el, int(c_nv_pr.get("id")), c_nv_pr.get("name"), bbox
+
+
+def paragraphs(el):
+    """Text of each a:p under *el*, with line breaks as newlines."""
+    out = []
+    for p in el.iter(f"{{{NS['a']}}}p"):
+        parts = []
+        for node in p:
+            if node.tag == f"{{{NS['a']}}}r" or node.tag == f"{{{NS['a']}}}fld":
+                t = node.find("a:t", NS)
+                parts.append((t.text or "") if t is not None else "")
+            elif node.tag == f"{{{NS['a']}}}br":
+                parts.append("\n")
+        out.append("".join(parts))
+    return out
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from lint_pptx import contrast_ratio, find_overlaps
+
+
+def _brute_force(boxes):
+    def solid(b):
+        return b[2] > b[0] and b[3] > b[1]
+
+    return {
+        (i, j)
+        for i in range(len(boxes)) for j in range(i + 1, len(boxes))
+        if solid(boxes[i]) and solid(boxes[j])
+        and boxes[i][0] < boxes[j][2] and boxes[j][0] < boxes[i][2]
+        and boxes[i][1] < boxes[j][3] and boxes[j][1] < boxes[i][3]
+    }
+
+
+def _random_boxes(rng, n, span=50, size=20):
+    boxes = []
+    for _ in range(n):
+        left, top = rng.randint(0, span), rng.randint(0, span)
+        boxes.append((left, top, left + rng.randint(0, size), top + rng.randint(0, size)))
+    return boxes
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_find_overlaps_matches_brute_force(seed):
+    rng = random.Random(seed)
+    boxes = _random_boxes(rng, rng.randint(0, 60))
+    pairs = find_overlaps(boxes)
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == _brute_force(boxes)
+
+
+def test_touching_edges_do_not_overlap():
+    boxes = [(0, 0, 10, 10), (10, 0, 20, 10), (0, 10, 10, 20), (10, 10, 20, 20)]
+    assert find_overlaps(boxes) == []
+
+
+def test_zero_area_boxes_never_overlap():
+    boxes = [(17, 26, 23, 43), (17, 33, 17, 47), (0, 30, 40, 30)]
+    assert find_overlaps(boxes) == []
+
+
+def test_stacked_column_and_containment():
+    boxes = [(0, i * 10, 100, i * 10 + 10) for i in range(50)] + [(40, 5, 60, 25)]
+    assert sorted(find_overlaps(boxes)) == [(0, 50), (1, 50), (2, 50)]
+
+
+def test_contrast_ratio_known_values():
+    assert contrast_ratio("000000", "FFFFFF") == pytest.approx(21.0)
+    assert contrast_ratio("FFFFFF", "FFFFFF") == pytest.approx(1.0)
+    assert contrast_ratio("777777", "FFFFFF") == pytest.approx(4.48, abs=0.01)
+    assert contrast_ratio("FFFFFF", "777777") == contrast_ratio("777777", "FFFFFF")
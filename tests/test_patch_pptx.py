@@ -0,0 +1,130 @@
+import os
+import zipfile
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches
+
+from patch_pptx import (_central_directory, _read_member, _replace_in_paragraph,
+                        _set_shape_text, main, patch)
+from pptx_parts import NS
+
+A = NS["a"]
+
+
+def _paragraph(*chunks, br_after_first=False):
+    runs = [f"<a:r><a:rPr b=\"{i % 2}\"/><a:t>{c}</a:t></a:r>" for i, c in enumerate(chunks)]
+    if br_after_first:
+        runs.insert(1, "<a:br/>")
+    return etree.fromstring(f'<a:p xmlns:a="{A}"><a:pPr/>{"".join(runs)}<a:endParaRPr/></a:p>')
+
+
+def _texts(p):
+    return [t.text for t in p.iterfind("a:r/a:t", NS)]
+
+
+def test_replace_within_one_run():
+    p = _paragraph("MIT License  |  v1.11")
+    assert _replace_in_paragraph(p, "v1.11", "v1.12") == 1
+    assert _texts(p) == ["MIT License  |  v1.12"]
+
+
+def test_replace_spanning_runs_keeps_first_run_formatting():
+    p = _paragraph("ver v1.", "11 and v1.11!")
+    assert _replace_in_paragraph(p, "v1.11", "v2.0") == 2
+    assert _texts(p) == ["ver v2.0", " and v2.0!"]
+
+
+def test_replace_spanning_three_runs():
+    p = _paragraph("disc", "ord.g", "g/old here")
+    assert _replace_in_paragraph(p, "discord.gg/old", "x") == 1
+    assert "".join(_texts(p)) == "x here"
+    assert _texts(p)[0] == "x"
+
+
+def test_replacement_containing_old_terminates():
+    p = _paragraph("a-a")
+    assert _replace_in_paragraph(p, "a", "aa") == 2
+    assert _texts(p) == ["aa-aa"]
+
+
+def test_set_shape_text_drops_breaks_and_extra_runs():
+    sp = etree.fromstring(
+        f'<p:sp xmlns:p="{NS["p"]}" xmlns:a="{A}"><p:txBody>'
+        f'{etree.tostring(_paragraph("NO ENTERPRISE", "THEATRE", br_after_first=True)).decode()}'
+        f'<a:p><a:r><a:t>second</a:t></a:r></a:p></p:txBody></p:sp>'
+    )
+    assert _set_shape_text(sp, "NEW") == 1
+    paras = sp.findall("p:txBody/a:p", NS)
+    assert len(paras) == 1
+    assert [etree.QName(c).localname for c in paras[0]] == ["pPr", "r", "endParaRPr"]
+    assert _texts(paras[0]) == ["NEW"]
+
+
+@pytest.fixture
+def deck(tmp_path):
+    prs = Presentation()
+    for text in ("footer v1.11", "Discord: discord.gg/old", "unchanged"):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+        slide.notes_slide.notes_text_frame.text = f"notes for {text}"
+    path = tmp_path / "deck.pptx"
+    prs.save(path)
+    os.chmod(path, 0o644)
+    return str(path)
+
+
+def _raw_members(path):
+    with open(path, "rb") as fp:
+        return {name: _read_member(fp, record)[1] for name, record in _central_directory(fp)}
+
+
+def test_patch_rewrites_only_matching_parts(deck):
+    before = _raw_members(deck)
+    assert patch(deck, [("v1.11", "v1.12")]) == {1: 1}
+
+    after = _raw_members(deck)
+    assert list(after) == list(before)
+    changed = [name for name in before if before[name] != after[name]]
+    assert changed == ["ppt/slides/slide1.xml"]
+    with zipfile.ZipFile(deck) as zf:
+        assert zf.testzip() is None
+    prs = Presentation(deck)
+    assert prs.slides[0].shapes[0].text_frame.text == "footer v1.12"
+    assert prs.slides[0].notes_slide.notes_text_frame.text == "notes for footer v1.11"
+
+
+def test_patch_keeps_file_mode(deck):
+    patch(deck, [("v1.11", "v1.12")])
+    assert os.stat(deck).st_mode & 0o777 == 0o644
+
+
+def test_patch_notes_only_when_asked(deck):
+    assert patch(deck, [("notes for", "Notes:")], notes=True) == {1: 1, 2: 1, 3: 1}
+    assert Presentation(deck).slides[2].notes_slide.notes_text_frame.text == "Notes: unchanged"
+
+
+def test_no_match_leaves_deck_untouched(deck, tmp_path):
+    out = tmp_path / "out.pptx"
+    assert patch(deck, [("absent", "x")], output=str(out)) == {}
+    assert not out.exists()
+
+
+def test_set_needs_one_slide(deck):
+    with pytest.raises(ValueError):
+        patch(deck, shape="TextBox 1", set_text="x")
+    assert patch(deck, slides=[2], shape="TextBox 1", set_text="x") == {2: 1}
+    assert Presentation(deck).slides[0].shapes[0].text_frame.text == "footer v1.11"
+
+
+def test_empty_old_is_rejected(deck):
+    with pytest.raises(ValueError):
+        patch(deck, [("", "x")])
+
+
+def test_set_with_replacements_is_rejected(deck):
+    with pytest.raises(ValueError):
+        patch(deck, [("v1.11", "v1.12")], slides=[1], shape="TextBox 1", set_text="x")
+    with pytest.raises(SystemExit):
+        main([deck, "--slide", "1", "--shape", "TextBox 1", "--set", "x", "-r", "v1.11", "v1.12"])